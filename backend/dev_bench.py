@@ -0,0 +1,108 @@
+import random
+import re
+import time
+
+from normalize import normalize_number
+from ocr_tokens import amounts, currency_of, first_date, iter_tokens, tokenize
+
+SAMPLES = [
+    "Description", "Qty", "Net price", "VAT [%]", "Total", "Invoice no: 51109338",
+    "Date of issue: 04/13/2013", "2024-03-05", "5 Mar 2024", "March 5th, 2024",
+    "$ 1,234.50", "1.234,56", "5 640,17", "€12", "100 EUR", "Rs. 1,50,000", "10%", "3,00", "22.50",
+]
+
+
+# Baseline helpers, copied from the pre-tokenizer code so both paths are timed side by side.
+def baseline_normalize_number(text: str) -> str:
+    cleaned = (text or "").replace("\u00a0", "").replace(" ", "")
+    if not cleaned:
+        return ""
+    if "," in cleaned and "." in cleaned and cleaned.rfind(",") > cleaned.rfind("."):
+        cleaned = cleaned.replace(".", "")
+    if cleaned.count(",") == 1 and cleaned.count(".") == 0:
+        cleaned = cleaned.replace(",", ".")
+    parts = cleaned.split(".")
+    if len(parts) > 2:
+        cleaned = "".join(parts[:-1]) + "." + parts[-1]
+    cleaned = re.sub(r"[^0-9\.-]", "", cleaned)
+    if cleaned.count(".") > 1:
+        first, *rest = cleaned.split(".")
+        cleaned = first + "." + "".join(rest)
+    return cleaned
+
+
+def baseline_strip_currency(text: str):
+    if not text:
+        return "", ""
+    currency = ""
+    for sym in ["$", "€", "£", "₹"]:
+        if sym in text:
+            currency = {"$": "USD", "€": "EUR", "£": "GBP", "₹": "INR"}[sym]
+            break
+    for code in ["USD", "EUR", "GBP", "INR", "AED"]:
+        if code in text.upper():
+            currency = code
+            break
+    return currency, baseline_normalize_number(text)
+
+
+def baseline_box(text: str):
+    """Per-box work before the tokenizer, across score_page, parse_items and summary_from_zone."""
+    numeric = any(c.isdigit() for c in text)
+    value = baseline_normalize_number(text) if numeric else ""
+    return numeric, value, baseline_strip_currency(text)
+
+
+def tokenized_box(text: str):
+    """Per-box work now: the digit check stays, the parsers share one tokenize() result."""
+    numeric = any(c.isdigit() for c in text)
+    tokens = tokenize(text)
+    return numeric, amounts(tokens), currency_of(tokens)
+
+
+def make_cells(n: int, seed: int = 7):
+    """Line boxes (PaddleOCR) and the word boxes Tesseract would return for the same lines."""
+    rnd = random.Random(seed)
+    lines = [f"{rnd.choice(SAMPLES)} {i}" for i in range(n)]
+    words = [w for line in lines for w in line.split()][:n]
+    return lines, words
+
+
+def bench(name: str, fn, items, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for it in items:
+            fn(it)
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<30} {best / len(items) * 1e6:>10.2f} us/op  {best * 1000:>8.1f} ms total")
+
+
+def run(n: int = 100_000):
+    cells, words = make_cells(n)
+    page = "\n".join(cells)
+    print(f"{n} line boxes, {n} word boxes, {len(page)} chars")
+
+    bench("baseline normalize_number", baseline_normalize_number, cells)
+    bench("normalize_number", normalize_number, cells)
+    bench("baseline strip_currency", baseline_strip_currency, cells)
+    bench("iter_tokens (lines)", lambda text: tuple(iter_tokens(text)), cells)
+    bench("tokenize (lines)", tokenize, cells)
+    bench("tokenize (words)", tokenize, words)
+
+    # one OCR box going through all parsing stages
+    bench("baseline per-box (words)", baseline_box, words)
+    bench("tokenized per-box (words)", tokenized_box, words)
+    bench("baseline per-box (lines)", baseline_box, cells)
+    bench("tokenized per-box (lines)", tokenized_box, cells)
+
+    bench("baseline zone fallback (page)",
+          lambda text: [baseline_strip_currency(m)[1] for m in re.findall(r"[$€£]?\s?[0-9][\d.,]*", text)], [page])
+    bench("iter_tokens (page)", lambda text: sum(1 for _ in iter_tokens(text)), [page])
+    # every line is searched, so neither side can stop at the first date on the page
+    bench("baseline date search (lines)", lambda text: re.search(r"(\d{2}[/-]\d{2}[/-]\d{4})", text), cells)
+    bench("first_date (lines)", first_date, cells)
+
+
+if __name__ == "__main__":
+    run()
@@ -6,6 +6,48 @@ from preprocess import preprocess_image
 from ocr_engine import ocr_extract
 from layout_parse import parse_invoice
 from pdf_utils import pdf_to_images
+from ocr_engine import OCRBox
+from extract_fields import summary_from_zone
+from ocr_tokens import DATE, amounts, first_date, tokenize
+
+
+def _row(*texts: str):
+    return [OCRBox(i * 10.0, 0.0, i * 10.0 + 8, 10.0, text, 1.0) for i, text in enumerate(texts)]
+
+
+def check_tokenizer():
+    # numbers next to words that only start like a month are not dates
+    assert amounts(tokenize("10 Marketing 2019")) == ["10", "2019"]
+    assert not [t for t in tokenize("10 Marketing 2019") if t.kind == DATE]
+    assert first_date("Phone 12-34-5678") == ""
+    # a hyphen inside a range or a phone number is not a minus sign
+    assert amounts(tokenize("1-2")) == ["1", "2"]
+    assert not [v for v in amounts(tokenize("Tel. 555-1234-5678")) if v.startswith("-")]
+    assert amounts(tokenize("-12.50")) == ["-12.50"]
+    # thousands grouping is dropped, the decimal mark kept
+    assert amounts(tokenize("1,234")) == ["1234"]
+    assert amounts(tokenize("$ 10,000")) == ["10000"]
+    assert amounts(tokenize("EUR 1.000")) == ["1000"]
+    assert amounts(tokenize("1.234,56")) == ["1234.56"]
+    assert amounts(tokenize("5 640,17")) == ["5640.17"]
+    assert amounts(tokenize("Rs. 1,50,000")) == ["150000"]
+    # numeric dates are day-first unless the second part can only be a day
+    assert first_date("03/05/2024") == "03-05-2024"
+    assert first_date("04/13/2013") == "13-04-2013"
+    assert first_date("2024-03-05") == "05-03-2024"
+    assert first_date("March 5th, 2024") == "05-03-2024"
+    assert first_date("5 Mar 2024") == "05-03-2024"
+
+
+def check_summary():
+    # a bare code on another row does not decide the currency, the total row does
+    assert summary_from_zone([_row("CAD 5"), _row("Total € 100")])[0] == "EUR"
+    assert summary_from_zone([_row("Total 1-2 items 50")])[3] == "50.0"
+    # word-level boxes split the symbol from the amount
+    assert summary_from_zone([_row("Total", "$", "1,234.50")]) == ("USD", "", "", "1234.5")
+    assert summary_from_zone([_row("Currency:", "USD"), _row("Total", "100")])[0] == "USD"
+    assert summary_from_zone([_row("Total", "usd 1,234.50")])[0] == "USD"
+    assert summary_from_zone([_row("Total", "USD100")])[0] == "USD"
 
 
 def run_sample_image(path: Path):
@@ -35,6 +77,8 @@ def run_sample_pdf(path: Path):
 
 
 if __name__ == "__main__":
+    check_tokenizer()
+    check_summary()
     sample_img = Path("..") / "frontend" / "public" / "sample-invoice.jpg"
     if sample_img.exists():
         run_sample_image(sample_img)
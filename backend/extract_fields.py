@@ -3,25 +3,24 @@ from __future__ import annotations
 import re
 from typing import List, Tuple
 
-from normalize import normalize_number, strip_currency
 from ocr_engine import OCRBox
 from models import Summary
+from ocr_tokens import amounts, currency_of, first_date, tokenize
+
+INVOICE_NUMBER_RE = re.compile(r"invoice\s*(?:no\.?|number|#)?[:\s]*([A-Za-z0-9-]+)", re.IGNORECASE)
+INVOICE_NUMBER_FALLBACK_RE = re.compile(r"invoice\s*[:\s]+([0-9]{4,})", re.IGNORECASE)
 
 
 def invoice_meta_from_text(raw_text: str) -> Tuple[str, str]:
     inv_number = ""
-    inv_date = ""
-    match = re.search(r"invoice\s*(?:no\.?|number|#)?[:\s]*([A-Za-z0-9-]+)", raw_text, re.IGNORECASE)
+    match = INVOICE_NUMBER_RE.search(raw_text)
     if match:
         inv_number = match.group(1)
     if not inv_number:
-        match = re.search(r"invoice\s*[:\s]+([0-9]{4,})", raw_text, re.IGNORECASE)
+        match = INVOICE_NUMBER_FALLBACK_RE.search(raw_text)
         if match:
             inv_number = match.group(1)
-    date_match = re.search(r"(\d{2}[/-]\d{2}[/-]\d{4})", raw_text)
-    if date_match:
-        inv_date = date_match.group(1).replace("/", "-")
-    return inv_number, inv_date
+    return inv_number, first_date(raw_text)
 
 
 def vendor_from_boxes(boxes: List[OCRBox]) -> str:
@@ -43,27 +42,23 @@ def vendor_from_boxes(boxes: List[OCRBox]) -> str:
     return ""
 
 
-def summary_from_zone(summary_rows: List[List[OCRBox]], summary_text: str) -> Tuple[str, str, str, str]:
+def summary_from_zone(summary_rows: List[List[OCRBox]]) -> Tuple[str, str, str, str]:
     subtotal = ""
     tax = ""
     total = ""
     currency = ""
-
-    def nums_from_row(row: List[OCRBox]) -> List[str]:
-        nonlocal currency
-        nums: List[str] = []
-        for b in row:
-            cur, num = strip_currency(b.text)
-            if cur and not currency:
-                currency = cur
-            if num:
-                nums.append(num)
-        return nums
+    total_currency = ""
+    all_nums: List[str] = []
 
     for row in summary_rows:
         text_low = " ".join(b.text for b in row).lower()
-        nums = nums_from_row(row)
+        row_tokens = [t for b in row for t in tokenize(b.text)]
+        nums = amounts(row_tokens)
+        row_currency = currency_of(row_tokens, labelled="currency" in text_low)
+        all_nums.extend(nums)
+        currency = currency or row_currency
         if "total" in text_low and nums:
+            total_currency = total_currency or row_currency
             nums_sorted = sorted([float(n) for n in nums], reverse=True)
             total = str(nums_sorted[0])
             if len(nums_sorted) > 1:
@@ -75,12 +70,10 @@ def summary_from_zone(summary_rows: List[List[OCRBox]], summary_text: str) -> Tu
             tax = nums[2] if len(nums) > 2 else tax
             total = nums[3] if len(nums) > 3 else total
 
-    if not total:
-        all_nums = re.findall(r"[$€£]?\s?[0-9][\d.,]*", summary_text)
-        normalized = [strip_currency(n)[1] for n in all_nums if strip_currency(n)[1]]
-        if normalized:
-            normalized.sort(key=lambda x: float(x), reverse=True)
-            total = normalized[0]
-            if len(normalized) > 1:
-                subtotal = normalized[-1]
-    return currency, subtotal, tax, total
+    if not total and all_nums:
+        all_nums.sort(key=lambda x: float(x), reverse=True)
+        total = all_nums[0]
+        if len(all_nums) > 1:
+            subtotal = all_nums[-1]
+    # the currency printed on the total row is the invoice currency
+    return total_currency or currency, subtotal, tax, total
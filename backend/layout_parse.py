@@ -3,8 +3,8 @@ from __future__ import annotations
 import statistics
 from typing import List, Tuple
 
-from normalize import normalize_number
 from ocr_engine import OCRBox
+from ocr_tokens import amounts, tokenize
 from models import LineItem, ExtractResponse, Summary
 from extract_fields import invoice_meta_from_text, vendor_from_boxes, summary_from_zone
 
@@ -61,6 +61,13 @@ def _looks_header(row: List[OCRBox]) -> bool:
     return any(w in text for w in HEADER_WORDS)
 
 
+def _cell_amount(cells: List[OCRBox], idx: int) -> str:
+    if idx >= len(cells):
+        return ""
+    values = amounts(tokenize(cells[idx].text))
+    return values[0] if values else ""
+
+
 def parse_items(rows: List[List[OCRBox]]) -> List[LineItem]:
     if not rows:
         return [LineItem(description="Line item")]
@@ -98,9 +105,9 @@ def parse_items(rows: List[List[OCRBox]]) -> List[LineItem]:
             continue
         description = _row_text(text_cells) or prev_desc or _row_text(row)
         numeric_cells_sorted = sorted(numeric_cells, key=lambda b: b.x1)
-        qty = normalize_number(numeric_cells_sorted[0].text) if len(numeric_cells_sorted) >= 1 else ""
-        unit_price = normalize_number(numeric_cells_sorted[1].text) if len(numeric_cells_sorted) >= 2 else ""
-        amount = normalize_number(numeric_cells_sorted[2].text) if len(numeric_cells_sorted) >= 3 else ""
+        qty = _cell_amount(numeric_cells_sorted, 0)
+        unit_price = _cell_amount(numeric_cells_sorted, 1)
+        amount = _cell_amount(numeric_cells_sorted, 2)
         items.append(LineItem(description=description, quantity=qty, unit_price=unit_price, amount=amount))
     if not items:
         items.append(LineItem(description=_row_text(rows[0])))
@@ -121,7 +128,7 @@ def parse_invoice(boxes: List[OCRBox], raw_text: str) -> ExtractResponse:
     summary_rows = group_rows(summary_zone, y_threshold=med_height * 0.6)
 
     items = parse_items(rows)
-    currency, subtotal, tax, total = summary_from_zone(summary_rows, "\n".join(b.text for b in summary_zone))
+    currency, subtotal, tax, total = summary_from_zone(summary_rows)
     inv_number, inv_date = invoice_meta_from_text(raw_text)
     vendor = vendor_from_boxes(boxes)
 
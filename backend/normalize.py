@@ -3,34 +3,67 @@ from typing import Tuple
 
 CURRENCY_MAP = {
     "$": "USD",
+    "US$": "USD",
     "€": "EUR",
     "£": "GBP",
     "₹": "INR",
+    "¥": "JPY",
     "AED": "AED",
+    "AUD": "AUD",
+    "CAD": "CAD",
+    "CHF": "CHF",
     "USD": "USD",
     "EUR": "EUR",
     "GBP": "GBP",
     "INR": "INR",
+    "JPY": "JPY",
+    "RS": "INR",
 }
 
+# Spellings matched in OCR text; currency_code() maps each of them onto CURRENCY_MAP.
+CURRENCY_SYMBOLS = ["US$", "$", "€", "£", "₹", "¥"]
+CURRENCY_CODES = ["AED", "AUD", "CAD", "CHF", "EUR", "GBP", "INR", "JPY", "USD", "RS", "Rs"]
+
+# Shared with ocr_tokens so both modules agree on what counts as a currency.
+# Codes are matched case-sensitively so words like "cad" or "rs" are not currencies.
+CURRENCY_PATTERN = "(?:{}|\\b(?:{})\\b)".format(
+    "|".join(re.escape(s) for s in CURRENCY_SYMBOLS),
+    "|".join(CURRENCY_CODES),
+)
+# Next to a number a code may be any case and glued on ("usd 12", "USD100").
+AMOUNT_CURRENCY_PATTERN = "(?:{}|(?<![A-Za-z])(?i:{})(?![A-Za-z]))".format(
+    "|".join(re.escape(s) for s in CURRENCY_SYMBOLS),
+    "|".join(CURRENCY_CODES),
+)
+
+_PLAIN_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+_NON_NUMERIC_RE = re.compile(r"[^0-9.\-]")
+
+
+def currency_code(text: str) -> str:
+    """Map a matched currency symbol or code (e.g. "$", "Rs.", "USD") to its ISO code."""
+    return CURRENCY_MAP.get(text.rstrip(".").upper(), "")
+
 
 def normalize_number(text: str) -> str:
     """Normalize EU/US number strings into dotted decimal representation."""
     cleaned = (text or "").replace("\u00a0", "").replace(" ", "")
     if not cleaned:
         return ""
-    if "," in cleaned and "." in cleaned and cleaned.rfind(",") > cleaned.rfind("."):
-        cleaned = cleaned.replace(".", "")
-    if cleaned.count(",") == 1 and cleaned.count(".") == 0:
-        cleaned = cleaned.replace(",", ".")
-    parts = cleaned.split(".")
-    if len(parts) > 2:
-        cleaned = "".join(parts[:-1]) + "." + parts[-1]
-    cleaned = re.sub(r"[^0-9\.-]", "", cleaned)
+    if _PLAIN_NUMBER_RE.fullmatch(cleaned):
+        return cleaned
+    comma = cleaned.rfind(",")
+    dot = cleaned.rfind(".")
+    if comma > dot:
+        # EU style: dots are thousands separators, the last comma is the decimal mark
+        if dot >= 0:
+            cleaned = cleaned.replace(".", "")
+        if cleaned.count(",") == 1:
+            cleaned = cleaned.replace(",", ".")
     if cleaned.count(".") > 1:
-        first, *rest = cleaned.split(".")
-        cleaned = first + "." + "".join(rest)
-    return cleaned
+        head, _, tail = cleaned.rpartition(".")
+        cleaned = head.replace(".", "") + "." + tail
+    return _NON_NUMERIC_RE.sub("", cleaned)
 
 
 def strip_currency(text: str) -> Tuple[str, str]:
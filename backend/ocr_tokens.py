@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable, Iterator, List, NamedTuple, Tuple
+
+from normalize import AMOUNT_CURRENCY_PATTERN, CURRENCY_PATTERN, currency_code
+
+CURRENCY = "currency"
+AMOUNT = "amount"
+DATE = "date"
+LABEL = "label"
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+_MON = (
+    r"(?i:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b\.?"
+)
+_ORD = r"(?i:st|nd|rd|th)?"
+_DAY = r"(?:3[01]|[12]\d|0?[1-9])"
+_MONTH = r"(?:1[0-2]|0?[1-9])"
+_YEAR = r"(?:19|20)\d{2}"
+
+# 03/12/2019, 12/13/2019, 3.12.2019, 2019-12-03, 3 Dec 2019, December 3rd, 2019.
+# Either numeric part may be the month; _date_value decides the order.
+_DATE = (
+    r"(?<!\d)(?:"
+    rf"(?P<dmy_dm>{_DAY}[/.-]{_MONTH}|{_MONTH}[/.-]{_DAY})[/.-](?P<dmy_y>{_YEAR})"
+    rf"|(?P<ymd_y>{_YEAR})[/.-](?P<ymd_m>{_MONTH})[/.-](?P<ymd_d>{_DAY})"
+    rf"|(?P<dmon_d>{_DAY}){_ORD}[ -](?P<dmon_m>{_MON}),?[ -](?P<dmon_y>{_YEAR})"
+    rf"|(?P<mond_m>{_MON}) (?P<mond_d>{_DAY}){_ORD},? (?P<mond_y>{_YEAR})"
+    r")(?!\d)"
+)
+
+# 1,234.56 / 1.234,56 / 5 640,17 / 1,50,000 / 1234 / 10% with an optional currency on either side
+# "-" is a sign only at the start or after whitespace/a currency, not inside ranges or IDs
+# A grouping separator must repeat consistently; the decimal mark is the other one.
+_NUMBER = (
+    r"(?:(?<![\w-])-)?(?:"
+    r"(?P<lakh>\d{1,2}(?:,\d{2})+,\d{3}(?:\.\d+)?)"
+    r"|\d{1,3}(?P<gsep>[,. \u00a0])\d{3}(?:(?P=gsep)\d{3})*(?:(?!(?P=gsep))[.,]\d+)?"
+    r"|\d+(?:[.,]\d+)?"
+    r")"
+)
+# The lookaheads let a plain number skip the currency alternatives on a single char test.
+_AMOUNT = (
+    rf"(?:(?=[^\d\s-])(?P<pre>{AMOUNT_CURRENCY_PATTERN})\.?[ \u00a0]?)?"
+    rf"(?P<num>{_NUMBER})%?"
+    rf"(?:(?=[ \u00a0]?[^\s\d.,-])[ \u00a0]?(?P<post>{AMOUNT_CURRENCY_PATTERN}))?"
+)
+
+# Leading whitespace is consumed with the token so gaps cost no failed match attempt, and
+# the date branch is only tried where a digit or a month name can start.
+_TOKEN_RE = re.compile(
+    r"\s*(?:"
+    rf"(?P<date>(?=\d|[A-Za-z]{{3}}){_DATE})"
+    rf"|(?P<amount>{_AMOUNT})"
+    rf"|(?P<currency>{CURRENCY_PATTERN})"
+    r"|(?P<label>[^\s\d$€£₹¥]+|\S)"
+    r")"
+)
+# Fast paths: most OCR boxes are a single word, and many hold no number at all.
+# A plain word number with at most two decimals can be neither grouped nor a date.
+_PLAIN_AMOUNT_RE = re.compile(r"(-?\d+(?:[.,]\d{1,2})?)%?")
+_WORD_RE = re.compile(rf"(?P<date>(?=\d|[A-Za-z]{{3}}){_DATE})|(?P<amount>{_AMOUNT})")
+_SPACE_RE = re.compile(r"\s")
+# Without a digit, a symbol or a code opening a word, every word of a box is a label.
+_NOT_ALL_LABELS_RE = re.compile(rf"[\d$€£₹¥]|(?<!\S){CURRENCY_PATTERN}")
+_DATE_RE = re.compile(_DATE)
+_DATE_SEP_RE = re.compile(r"[/.-]")
+
+
+class Token(NamedTuple):
+    kind: str
+    text: str
+    value: str = ""
+    currency: str = ""
+
+
+def _date_value(m: re.Match) -> str:
+    """Render a date match as dd-mm-yyyy.
+
+    Numeric dates are read day-first unless the second part is above 12, which can only be
+    a month-first date (04/13/2013). When both parts are 12 or less the input is ambiguous
+    and is still read day-first, so 03/05/2024 becomes 03-05-2024 (3 May).
+    """
+    dm, dmy_y, ymd_y, ymd_m, ymd_d, dmon_d, dmon_m, dmon_y, mond_m, mond_d, mond_y = m.group(
+        "dmy_dm", "dmy_y", "ymd_y", "ymd_m", "ymd_d", "dmon_d", "dmon_m", "dmon_y", "mond_m", "mond_d", "mond_y"
+    )
+    if dm:
+        day, month = _DATE_SEP_RE.split(dm)
+        if int(month) > 12:
+            day, month = month, day
+        year = dmy_y
+    elif ymd_y:
+        day, month, year = ymd_d, ymd_m, ymd_y
+    elif dmon_d:
+        day, month, year = dmon_d, str(MONTHS[dmon_m[:3].lower()]), dmon_y
+    else:
+        day, month, year = mond_d, str(MONTHS[mond_m[:3].lower()]), mond_y
+    return f"{day.zfill(2)}-{month.zfill(2)}-{year}"
+
+
+def _amount_value(num: str, lakh: str, gsep: str) -> str:
+    """Dotted decimal for a matched number.
+
+    The pattern already fixed the structure, so dropping the grouping separators it
+    recognised leaves at most one decimal mark; 1,234 and 1.000 stay thousands.
+    """
+    if lakh:
+        num = num.replace(",", "")
+    elif gsep:
+        num = num.replace(gsep, "")
+    return num.replace(",", ".")
+
+
+def _token(m: re.Match) -> Token:
+    # the outer kind groups close last, so lastgroup names the token kind
+    kind = m.lastgroup
+    raw = m.group(kind)
+    if kind == LABEL:
+        return Token(LABEL, raw)
+    if kind == AMOUNT:
+        num, lakh, gsep, pre, post = m.group("num", "lakh", "gsep", "pre", "post")
+        cur = pre or post
+        return Token(AMOUNT, raw, _amount_value(num, lakh, gsep), currency_code(cur) if cur else "")
+    if kind == DATE:
+        return Token(DATE, raw, _date_value(m))
+    return Token(CURRENCY, raw, currency=currency_code(raw))
+
+
+def iter_tokens(text: str) -> Iterator[Token]:
+    """Scan text once, classifying each token as currency, amount, date or label."""
+    return map(_token, _TOKEN_RE.finditer(text or ""))
+
+
+def tokenize(text: str) -> Tuple[Token, ...]:
+    """Tokens of one OCR box; same result as iter_tokens, skipping the full scan when it can.
+
+    Boxes without a digit, a symbol or a code are all labels, and a single word is matched
+    whole; only multi-word boxes with numbers go through the full scan.
+    """
+    text = text or ""
+    if not _NOT_ALL_LABELS_RE.search(text):
+        return tuple(Token(LABEL, word) for word in text.split())
+    word = text.strip()
+    if not _SPACE_RE.search(word):
+        m = _PLAIN_AMOUNT_RE.fullmatch(word)
+        if m:
+            return (Token(AMOUNT, word, m.group(1).replace(",", ".")),)
+        m = _WORD_RE.fullmatch(word)
+        if m:
+            return (_token(m),)
+    return tuple(map(_token, _TOKEN_RE.finditer(text)))
+
+
+def amounts(tokens: Iterable[Token]) -> List[str]:
+    return [t.value for t in tokens if t.kind == AMOUNT]
+
+
+def currency_of(tokens: Iterable[Token], labelled: bool = False) -> str:
+    """Currency of a row of tokens.
+
+    A currency attached to an amount wins. A bare currency token only counts when the row
+    also has an amount (word-level OCR splits "$" from "1,234.50") or is labelled as one.
+    """
+    bare = ""
+    has_amount = False
+    for t in tokens:
+        if t.kind == AMOUNT:
+            if t.currency:
+                return t.currency
+            has_amount = True
+        elif t.kind == CURRENCY and not bare:
+            bare = t.currency
+    return bare if has_amount or labelled else ""
+
+
+def first_date(text: str) -> str:
+    match = _DATE_RE.search(text or "")
+    return _date_value(match) if match else ""